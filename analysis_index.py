@@ -0,0 +1,114 @@
+# analysis_index.py
+
+import numpy as np
+import pandas as pd
+
+
+class CatalogIndex:
+    """
+    Índice pré-agregado do catálogo Kepler para exploração interativa.
+
+    Constrói, uma única vez, um histograma 3-D (log período × log raio × temperatura
+    estelar) por disposição. Os filtros de intervalo são respondidos somando fatias
+    deste cubo, sem tocar nas linhas originais; estas só são lidas no drill-down,
+    através de um índice ordenado pelo bin de período.
+    """
+    def __init__(self, df, period_bins=40, radius_bins=40, teff_bins=30,
+                 disposition_col='koi_disposition', period_col='koi_period',
+                 radius_col='koi_prad', teff_col='koi_steff'):
+        """
+        Args:
+            df (pd.DataFrame): O catálogo Kepler (data/kepler.csv).
+            period_bins (int): Número de bins logarítmicos para o período orbital.
+            radius_bins (int): Número de bins logarítmicos para o raio planetário.
+            teff_bins (int): Número de bins lineares para a temperatura estelar.
+        """
+        period = df[period_col].to_numpy(dtype=float)
+        radius = df[radius_col].to_numpy(dtype=float)
+        teff = df[teff_col].to_numpy(dtype=float)
+        valid = (np.isfinite(period) & (period > 0) & np.isfinite(radius) & (radius > 0)
+                 & np.isfinite(teff) & df[disposition_col].notna().to_numpy())
+
+        # Apenas as linhas indexáveis são guardadas; as restantes nunca entram nos gráficos
+        self.rows = df.loc[valid].reset_index(drop=True)
+        self.excluded = int((~valid).sum())
+        log_period = np.log10(period[valid])
+        log_radius = np.log10(radius[valid])
+        teff = teff[valid]
+
+        self.dispositions = tuple(self.rows[disposition_col].value_counts().index)
+        disposition_codes = pd.Categorical(self.rows[disposition_col], categories=self.dispositions).codes
+
+        self.period_edges = _edges(log_period, period_bins)
+        self.radius_edges = _edges(log_radius, radius_bins)
+        self.teff_edges = _edges(teff, teff_bins)
+
+        # Bin de cada linha em cada eixo, para que o drill-down coincida exatamente com o cubo
+        self._period_bin = _bin_of(log_period, self.period_edges)
+        self._radius_bin = _bin_of(log_radius, self.radius_edges)
+        self._teff_bin = _bin_of(teff, self.teff_edges)
+        self._disposition_code = disposition_codes.astype(np.int8)
+
+        self.cube = np.zeros((len(self.dispositions), period_bins, radius_bins, teff_bins), dtype=np.int32)
+        np.add.at(self.cube, (self._disposition_code, self._period_bin, self._radius_bin, self._teff_bin), 1)
+
+        # Índice ordenado pelo bin de período: um intervalo de período é um slice contíguo
+        self._order = np.argsort(self._period_bin, kind='stable')
+        self._sorted_period_bin = self._period_bin[self._order]
+
+        for array in (self.cube, self.period_edges, self.radius_edges, self.teff_edges,
+                      self._period_bin, self._radius_bin, self._teff_bin, self._disposition_code,
+                      self._order, self._sorted_period_bin):
+            array.flags.writeable = False
+
+    def _slice(self, dispositions, period_range, radius_range, teff_range):
+        """Devolve a fatia do cubo para os filtros dados (intervalos em índices de bin, [início, fim))."""
+        codes = [self.dispositions.index(d) for d in dispositions]
+        return self.cube[codes,
+                         period_range[0]:period_range[1],
+                         radius_range[0]:radius_range[1],
+                         teff_range[0]:teff_range[1]]
+
+    def counts(self, dispositions, period_range, radius_range, teff_range):
+        """Número de objetos por disposição que satisfazem os filtros."""
+        sub = self._slice(dispositions, period_range, radius_range, teff_range)
+        return pd.Series(sub.sum(axis=(1, 2, 3)), index=list(dispositions))
+
+    def period_radius_histogram(self, dispositions, period_range, radius_range, teff_range):
+        """Histograma 2-D (log período × log raio) dos objetos filtrados."""
+        return self._slice(dispositions, period_range, radius_range, teff_range).sum(axis=(0, 3))
+
+    def teff_histogram(self, dispositions, period_range, radius_range, teff_range):
+        """Histograma 1-D da temperatura estelar dos objetos filtrados."""
+        return self._slice(dispositions, period_range, radius_range, teff_range).sum(axis=(0, 1, 2))
+
+    def drill_down(self, dispositions, period_range, radius_range, teff_range):
+        """Linhas originais que satisfazem os filtros, lidas apenas a partir do índice ordenado."""
+        start, stop = np.searchsorted(self._sorted_period_bin, period_range, side='left')
+        candidates = self._order[start:stop]
+        codes = [self.dispositions.index(d) for d in dispositions]
+        mask = (np.isin(self._disposition_code[candidates], codes)
+                & (self._radius_bin[candidates] >= radius_range[0]) & (self._radius_bin[candidates] < radius_range[1])
+                & (self._teff_bin[candidates] >= teff_range[0]) & (self._teff_bin[candidates] < teff_range[1]))
+        return self.rows.iloc[np.sort(candidates[mask])]
+
+
+def nonempty_range(bin_range, n_bins):
+    """Garante que um intervalo de índices de bin [início, fim) contém pelo menos um bin."""
+    start = min(bin_range[0], n_bins - 1)
+    return start, max(bin_range[1], start + 1)
+
+
+def _edges(values, bins):
+    """Limites de bins igualmente espaçados cobrindo todos os valores."""
+    if len(values) == 0:
+        return np.linspace(0.0, 1.0, bins + 1)
+    low, high = float(values.min()), float(values.max())
+    if low == high:
+        high = low + 1.0
+    return np.linspace(low, high, bins + 1)
+
+
+def _bin_of(values, edges):
+    """Índice do bin de cada valor; o limite superior pertence ao último bin."""
+    return np.clip(np.searchsorted(edges, values, side='right') - 1, 0, len(edges) - 2).astype(np.int16)
@@ -5,323 +5,37 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 from model import ExoplanetModel
+from i18n import load_translations, load_css
+from analysis_index import CatalogIndex, nonempty_range
+import numpy as np
 import os
+import time
+
+# Tempo de execução do script por rerun (ativar com EXOPLANET_PROFILE=1)
+_rerun_start = time.perf_counter()
 
 # --- CONFIGURAÇÕES DA PÁGINA E ESTILO ---
 st.set_page_config(page_title="Exoplanet Detector AI", layout="wide", initial_sidebar_state="expanded")
-sns.set_theme(style="whitegrid", palette="viridis")
-
-# --- CSS CUSTOMIZADO ---
-st.markdown("""
-<style>
-/* Seletor de Idioma */
-.language-selector {
-    position: relative;
-    display: inline-block;
-    width: 100%;
-    margin-bottom: 10px;
-}
-.language-button {
-    background-color: #222;
-    color: white;
-    padding: 10px 15px;
-    font-size: 16px;
-    border: 1px solid #444;
-    border-radius: 0.5rem;
-    cursor: default;
-    width: 100%;
-    text-align: left;
-}
-.language-dropdown {
-    display: none;
-    position: absolute;
-    background-color: #f1f1f1;
-    min-width: 100%;
-    box-shadow: 0px 8px 16px 0px rgba(0,0,0,0.2);
-    z-index: 1;
-    border-radius: 0.5rem;
-}
-.language-dropdown a {
-    color: black;
-    padding: 12px 16px;
-    text-decoration: none;
-    display: block;
-    font-size: 16px;
-}
-.language-dropdown a:hover {background-color: #ddd;}
-.language-selector:hover .language-dropdown {display: block;}
-
-/* Cartões de Navegação Animados */
-div[data-testid="stVerticalBlock"] div[data-testid="stVerticalBlock"] div[data-testid="stVerticalBlock"] div[data-testid="stButton"] button {
-    width: 100%;
-    height: 100%;
-    padding: 2rem;
-    border-radius: 0.5rem;
-    transition: transform 0.2s ease-in-out, box-shadow 0.2s ease-in-out;
-}
-div[data-testid="stVerticalBlock"] div[data-testid="stVerticalBlock"] div[data-testid="stVerticalBlock"] div[data-testid="stButton"] button:hover {
-    transform: scale(1.03);
-    box-shadow: 0 8px 25px rgba(0,0,0,0.2);
-}
-</style>
-""", unsafe_allow_html=True)
 
-# --- DICIONÁRIO DE TRADUÇÕES (i18n) ---
-translations = {
-    'en': {
-        # ... UI Metadata
-        "sidebar_title": "🛰️ Exoplanet Detector",
-        "sidebar_subtitle": "An AI to classify objects of interest based on NASA data.",
-        "lang_current": "🇬🇧 English",
-        "lang_switch_to": "🇧🇷 Português",
-        "lang_switch_code": "pt",
-        "back_to_home": "⬅️ Back to Home",
-
-        # ... Home Page
-        "home_title": "Welcome to the Exoplanet Detector AI",
-        "home_subtitle": "Choose a tool below to begin your exploration.",
-        "home_card1_title": "🤖 AI Classifier",
-        "home_card1_text": "Use our trained AI to classify new exoplanet candidates from a file or by manually entering data.",
-        "home_card1_button": "Access Classifier",
-        "home_card2_title": "📊 Data Analysis",
-        "home_card2_text": "Visually explore the Kepler dataset with interactive charts and discover the patterns our AI learned from.",
-        "home_card2_button": "Explore Data",
-        "home_card3_title": "📖 Reference Guide",
-        "home_card3_text": "Learn about exoplanets, how our AI works step-by-step, its performance, and details about our project.",
-        "home_card3_button": "Read the Guide",
-        
-        # ... Classifier Texts
-        "classifier_title": "Exoplanet Classification Panel",
-        "classifier_tab_file": "Classify by File",
-        "classifier_tab_manual": "Classify Manually",
-        "file_uploader_label": "Choose a CSV file with candidate data:",
-        "example_button": "Use a Random Example",
-        "classify_file_button": "Classify Object from File",
-        "manual_header": "Insert data manually (key features)",
-        "classify_manual_button": "Classify with Manual Data",
-        "form_koi_score": "KOI Score",
-        "form_koi_period": "Orbital Period [days]",
-        "form_koi_prad": "Planetary Radius [Earth radii]",
-        "form_koi_duration": "Transit Duration [hours]",
-        "form_koi_depth": "Transit Depth [ppm]",
-        "form_koi_teq": "Equilibrium Temp. [K]",
-        "spinner_text": "Analyzing data with the AI...",
-        "analysis_finished": "✅ Analysis Complete!",
-        "result_header": "Classification Result:",
-        "confidence_header": "Confidence Level:",
-        "class_candidate": "Candidate",
-        "class_confirmed": "Confirmed",
-        "class_false_positive": "False Positive",
-        "warning_ia": "⚠️ **AI Warning:** {}",
-        "error_prediction": "❌ Prediction Error: {}",
-        "example_success": "Random example loaded!",
-        "sample_data_header": "Sample of uploaded data:",
-        "example_data_header": "Using a random example:",
-        "file_read_error": "Error reading CSV file: {}",
-
-        # ... Data Analysis Texts
-        "analysis_title": "Exploratory Data Analysis",
-        "analysis_subtitle": "Visualizing the Kepler dataset to uncover patterns and understand the foundation upon which our AI was trained.",
-        "analysis_chart1_title": "Exoplanet Dispositions in the Dataset",
-        "analysis_chart1_desc": """
-        This bar chart shows the distribution of the three main classes in our dataset. We can observe a significant class imbalance: **False Positives** are the most common, while **Confirmed** planets are the rarest. This is why techniques like SMOTE were used during training to help the AI learn effectively.
-        """,
-        "analysis_chart2_title": "Orbital Period vs. Planetary Radius",
-        "analysis_chart2_desc": """
-        This scatter plot reveals the relationship between a planet's "year" and its size. The log scale helps visualize the wide range of values. We can see a dense cluster of planets with short orbital periods (less than 100 days), which are easier to detect because they transit their star more frequently.
-        """,
-        "analysis_chart3_title": "Distribution of Stellar Equilibrium Temperatures",
-        "analysis_chart3_desc": """
-        This histogram shows that the Kepler mission was particularly effective at observing Sun-like stars (peaking around 5500-6000 K), which is ideal for the search for potentially habitable exoplanets.
-        """,
-        "analysis_chart4_title": "What Does the AI Consider Most Important?",
-        "analysis_chart4_desc": """
-        This chart displays the **feature importances** from our AI. It shows which data columns the AI relies on most to make a decision. Unsurprisingly, `koi_score` and the various `koi_fpflag` (False Positive Flags) are highly important, confirming that the AI is focusing on scientifically relevant variables.
-        """,
-        "analysis_chart1_xlabel": "Disposition Class",
-        "analysis_chart1_ylabel": "Number of Samples",
-        "analysis_chart2_xlabel": "Orbital Period [log scale, days]",
-        "analysis_chart2_ylabel": "Planetary Radius [log scale, Earth radii]",
-        "analysis_chart3_xlabel": "Equilibrium Temperature [K]",
-        "analysis_chart3_ylabel": "Frequency",
-        "analysis_chart4_xlabel": "Importance Score",
-        "analysis_chart4_ylabel": "Feature Name",
-
-        # ... Reference Guide Texts
-        "ref_title": "Reference Guide: Understanding Exoplanets and Our AI",
-        "ref_about_title": "About This Project",
-        "ref_about_text": """
-        This application was developed in response to the **[A World Away: Hunting for Exoplanets with AI](https://www.spaceappschallenge.org/2025/challenges/a-world-away-hunting-for-exoplanets-with-ai/?tab=details)** challenge from the NASA International Space Apps Challenge 2025. Our goal was to create a tool that not only fulfills the challenge's objective but is also powerful for analysis and accessible for educational purposes.
-
-        **Why use our AI?**
-        Manually analyzing hundreds of thousands of light curves is impossible. Our AI automates and accelerates this process. It acts as an incredibly effective, intelligent filter that:
-        - **Saves Time:** Classifies a new candidate in a fraction of a second, allowing scientists to efficiently sift through massive datasets.
-        - **Increases Efficiency:** By accurately identifying False Positives, it prevents astronomers from wasting valuable telescope time on signals that are not real planets.
-        - **Accelerates Discovery:** By highlighting the most promising candidates, it accelerates the pace of discovery in the search for new worlds.
-        
-        **Project Links:**
-        - **[View the Source Code on GitHub](https://github.com/gasbriel07sm/hackathon_exoplanet)**
-        """,
-        "ref_pipeline_title": "How Does Our AI Work? The Pipeline Step-by-Step",
-        "ref_pipeline_text": """
-        Our AI uses a **Machine Learning Pipeline** to ensure every new piece of data is analyzed consistently.
-        
-        1.  **During Training:** We loaded and unified NASA data, split it, and preprocessed it by filling missing values (imputation), converting text to numbers (encoding), balancing rare classes (SMOTE), and normalizing feature scales (scaling). We then trained an XGBoost model.
-        2.  **During Prediction:** When you classify data, the app applies the exact same saved preprocessing steps before feeding it to the trained model to get a result. This rigor ensures every prediction is reliable.
-        """,
-        "ref_performance_title": "Our AI's Performance",
-        "ref_performance_text": """
-        To ensure our model is reliable, it was rigorously evaluated on a separate test set. The model achieved:
-        - **Overall Accuracy: 98.46%**
-        This high accuracy means the model is extremely effective at correctly classifying signals, which is crucial for efficiently filtering through vast amounts of data to find genuine exoplanet signals.
-        """,
-        "ref_what_are_exoplanets_title": "What are Exoplanets?",
-        "ref_what_are_exoplanets_text": """
-        An exoplanet is any planet beyond our solar system. They come in a wide variety of sizes and orbits, from gas giants to rocky worlds like Earth.
-        """,
-        "ref_how_ai_helps_title": "What Our AI Does",
-        "ref_how_ai_helps_text": """
-        Our AI uses a powerful **XGBoost** model to recognize the subtle patterns in transit data, determine which features are most important, and classify candidates in a fraction of a second.
-        """,
-        "ref_dispositions_title": "Understanding the Classifications",
-        "ref_dispositions_text": """
-        - **Candidate:** A promising signal that looks like a planet and is worthy of follow-up observations.
-        - **False Positive:** A signal that mimics a planet but is caused by something else (e.g., other stars, instrument noise).
-        - **Confirmed:** A candidate that has been verified as a true exoplanet through further observations.
-        """,
-    },
-    'pt': {
-        # ... Metadados da UI
-        "sidebar_title": "🛰️ Detector de Exoplanetas",
-        "sidebar_subtitle": "Uma IA para classificar objetos de interesse com base em dados da NASA.",
-        "lang_current": "🇧🇷 Português",
-        "lang_switch_to": "🇬🇧 Inglês",
-        "lang_switch_code": "en",
-        "back_to_home": "⬅️ Voltar ao Início",
-
-        # ... Página Principal
-        "home_title": "Bem-vindo ao Detector de Exoplanetas com IA",
-        "home_subtitle": "Escolha uma ferramenta abaixo para começar a sua exploração.",
-        "home_card1_title": "🤖 Classificador de IA",
-        "home_card1_text": "Use a nossa IA treinada para classificar novos candidatos a exoplanetas a partir de um arquivo ou inserindo dados manualmente.",
-        "home_card1_button": "Aceder ao Classificador",
-        "home_card2_title": "📊 Análise de Dados",
-        "home_card2_text": "Explore visualmente o dataset Kepler com gráficos interativos e descubra os padrões que a nossa IA aprendeu.",
-        "home_card2_button": "Explorar os Dados",
-        "home_card3_title": "📖 Guia de Referência",
-        "home_card3_text": "Aprenda sobre exoplanetas, como a nossa IA funciona passo a passo, a sua performance e detalhes sobre o nosso projeto.",
-        "home_card3_button": "Ler o Guia",
-
-        # ... Textos do Classificador
-        "classifier_title": "Painel de Classificação de Exoplanetas",
-        "classifier_tab_file": "Classificar por Arquivo",
-        "classifier_tab_manual": "Classificar Manualmente",
-        "file_uploader_label": "Escolha um arquivo CSV com os dados do candidato:",
-        "example_button": "Usar um Exemplo Aleatório",
-        "classify_file_button": "Classificar Objeto do Arquivo",
-        "manual_header": "Inserir dados manualmente (principais características)",
-        "classify_manual_button": "Classificar com Dados Manuais",
-        "form_koi_score": "Score KOI",
-        "form_koi_period": "Período Orbital [dias]",
-        "form_koi_prad": "Raio Planetário [raios terrestres]",
-        "form_koi_duration": "Duração do Trânsito [horas]",
-        "form_koi_depth": "Profundidade do Trânsito [ppm]",
-        "form_koi_teq": "Temp. de Equilíbrio [K]",
-        "spinner_text": "Analisando os dados com a IA...",
-        "analysis_finished": "✅ Análise Concluída!",
-        "result_header": "Resultado da Classificação:",
-        "confidence_header": "Nível de Confiança:",
-        "class_candidate": "Candidato",
-        "class_confirmed": "Confirmado",
-        "class_false_positive": "Falso Positivo",
-        "warning_ia": "⚠️ **Aviso da IA:** {}",
-        "error_prediction": "❌ Erro na previsão: {}",
-        "example_success": "Exemplo aleatório carregado!",
-        "sample_data_header": "Amostra dos dados enviados:",
-        "example_data_header": "Usando um exemplo aleatório:",
-        "file_read_error": "Erro ao ler o arquivo CSV: {}",
-        
-        # ... Textos de Análise de Dados
-        "analysis_title": "Análise Exploratória de Dados",
-        "analysis_subtitle": "Visualizando o dataset Kepler para descobrir padrões e entender a base sobre a qual a nossa IA foi treinada.",
-        "analysis_chart1_title": "Disposições de Exoplanetas no Dataset",
-        "analysis_chart1_desc": """
-        Este gráfico de barras mostra a distribuição das três classes principais no nosso dataset. Podemos observar um desequilíbrio de classes significativo: **Falsos Positivos** são a classe mais comum, enquanto planetas **Confirmados** são os mais raros. É por isso que técnicas como o SMOTE foram usadas durante o treino para ajudar a IA a aprender eficazmente.
-        """,
-        "analysis_chart2_title": "Período Orbital vs. Raio Planetário",
-        "analysis_chart2_desc": """
-        Este gráfico de dispersão revela a relação entre o "ano" de um planeta e o seu tamanho. A escala logarítmica ajuda a visualizar a vasta gama de valores. Vemos um denso aglomerado de planetas com períodos orbitais curtos (menos de 100 dias), que são mais fáceis de detetar porque transitam pela sua estrela com mais frequência.
-        """,
-        "analysis_chart3_title": "Distribuição da Temperatura de Equilíbrio das Estrelas",
-        "analysis_chart3_desc": """
-        Este histograma mostra que a missão Kepler foi particularmente eficaz na observação de estrelas do tipo solar (com pico por volta de 5500-6000 K), o que é ideal para a busca por exoplanetas potencialmente habitáveis.
-        """,
-        "analysis_chart4_title": "O Que a IA Considera Mais Importante?",
-        "analysis_chart4_desc": """
-        Este gráfico exibe a **importância das características** da nossa IA. Ele mostra em quais colunas de dados a IA mais se baseia para tomar uma decisão. Não surpreendentemente, o `koi_score` e as várias `koi_fpflag` (Bandeiras de Falso Positivo) são altamente importantes, o que confirma que a IA está a focar-se em variáveis cientificamente relevantes.
-        """,
-        "analysis_chart1_xlabel": "Classe de Disposição",
-        "analysis_chart1_ylabel": "Número de Amostras",
-        "analysis_chart2_xlabel": "Período Orbital [escala log, dias]",
-        "analysis_chart2_ylabel": "Raio Planetário [escala log, raios terrestres]",
-        "analysis_chart3_xlabel": "Temperatura de Equilíbrio [K]",
-        "analysis_chart3_ylabel": "Frequência",
-        "analysis_chart4_xlabel": "Pontuação de Importância",
-        "analysis_chart4_ylabel": "Nome da Característica",
-
-        # ... Textos do Guia de Referência
-        "ref_title": "Guia de Referência: Entendendo os Exoplanetas e a Nossa IA",
-        "ref_about_title": "Sobre Este Projeto",
-        "ref_about_text": """
-        Esta aplicação foi desenvolvida em resposta ao desafio **[A World Away: Hunting for Exoplanets with AI](https://www.spaceappschallenge.org/2025/challenges/a-world-away-hunting-for-exoplanets-with-ai/?tab=details)** do NASA International Space Apps Challenge 2025. O nosso objetivo foi criar uma ferramenta que não apenas cumprisse o objetivo do desafio, mas que também fosse poderosa para análise e acessível para fins educativos.
-
-        **Por que usar a nossa IA?**
-        Analisar manualmente centenas de milhares de curvas de luz é impossível. A nossa IA automatiza e acelera este processo. Ela atua como um filtro inteligente e incrivelmente eficaz que:
-        - **Poupa Tempo:** Classifica um novo candidato numa fração de segundo, permitindo que os cientistas analisem eficientemente conjuntos de dados massivos.
-        - **Aumenta a Eficiência:** Ao identificar com precisão os Falsos Positivos, evita que os astrónomos desperdicem tempo valioso de telescópio em sinais que não são planetas reais.
-        - **Acelera a Descoberta:** Ao destacar os candidatos mais promissores, acelera o ritmo da descoberta na busca por novos mundos.
-        
-        **Links do Projeto:**
-        - **[Ver o Código Fonte no GitHub](https://github.com/gasbriel07sm/hackathon_exoplanet)**
-        """,
-        "ref_pipeline_title": "Como Funciona a Nossa IA? O Pipeline Passo a Passo",
-        "ref_pipeline_text": """
-        A nossa IA utiliza um **Pipeline de Machine Learning** para garantir que cada novo dado seja analisado de forma consistente.
-        
-        1.  **Durante o Treino:** Carregamos e unificamos dados da NASA, os dividimos, e os pré-processamos preenchendo valores em falta (imputação), convertendo texto para números (codificação), balanceando classes raras (SMOTE) e normalizando as escalas das características (scaling). Em seguida, treinamos um modelo XGBoost.
-        2.  **Durante a Previsão:** Quando você classifica um dado, a aplicação usa os mesmos componentes de pré-processamento salvos para tratar os seus dados antes de os entregar ao modelo treinado para obter um resultado. Este rigor garante que cada previsão seja confiável.
-        """,
-        "ref_performance_title": "Performance da Nossa IA",
-        "ref_performance_text": """
-        Para garantir que o nosso modelo é confiável, ele foi rigorosamente avaliado num conjunto de dados de teste que nunca tinha visto durante o treino. O modelo alcançou:
-        - **Precisão Geral: 98.46%**
-        Esta alta pontuação de precisão significa que o modelo é extremamente eficaz na classificação correta de sinais, o que é crucial para filtrar eficientemente grandes quantidades de dados para encontrar sinais genuínos de exoplanetas.
-        """,
-        "ref_what_are_exoplanets_title": "O que são Exoplanetas?",
-        "ref_what_are_exoplanets_text": """
-        Um exoplaneta é qualquer planeta para além do nosso sistema solar. Eles existem numa grande variedade de tamanhos e órbitas, desde gigantes gasosos a mundos rochosos como a Terra.
-        """,
-        "ref_how_ai_helps_title": "O Que a Nossa IA Faz",
-        "ref_how_ai_helps_text": """
-        Analisar manualmente centenas de milhares de curvas de luz é impossível. A nossa IA automatiza este processo usando um poderoso modelo **XGBoost** para reconhecer os padrões subtis nos dados de trânsito, determinar quais características são mais importantes e classificar candidatos numa fração de segundo.
-        """,
-        "ref_dispositions_title": "Entendendo as Classificações",
-        "ref_dispositions_text": """
-        - **Candidato:** Um sinal promissor que se parece com um planeta e merece mais observações.
-        - **Falso Positivo:** Um sinal que imita um planeta, mas é causado por outra coisa (ex: outras estrelas, ruído do instrumento).
-        - **Confirmado:** Um candidato que foi verificado como um verdadeiro exoplaneta através de observações adicionais.
-        """,
-    }
-}
-# Adicionar chaves em falta para evitar KeyErrors
-for lang in translations:
-    for key, value in translations['en'].items():
-        if key not in translations[lang]:
-            translations[lang][key] = value
-    for key, value in translations['pt'].items():
-        if key not in translations[lang]:
-            translations[lang][key] = value
+# --- RECURSOS ESTÁTICOS (carregados uma única vez por processo) ---
+@st.cache_resource(show_spinner=False)
+def get_translations():
+    """Catálogo i18n só de leitura, partilhado por todas as sessões."""
+    return load_translations('locales/')
 
+@st.cache_resource(show_spinner=False)
+def get_css():
+    """Folha de estilos da aplicação, lida do disco apenas uma vez."""
+    return load_css('static/style.css')
+
+@st.cache_resource(show_spinner=False)
+def apply_plot_theme():
+    """O tema do seaborn é global ao processo, basta aplicá-lo uma vez."""
+    sns.set_theme(style="whitegrid", palette="viridis")
+
+apply_plot_theme()
+# O Streamlit reconstrói a página a cada rerun, por isso o <style> tem de ser reemitido
+st.markdown(get_css(), unsafe_allow_html=True)
 
 # --- FUNÇÕES AUXILIARES ---
 @st.cache_resource(show_spinner=False)
@@ -343,6 +57,12 @@ def load_analysis_data():
         st.error(f"File '{file_path}' not found.")
         return None
 
+@st.cache_resource(show_spinner=False)
+def load_catalog_index():
+    """Constrói uma única vez o índice pré-agregado usado pelos filtros da página de análise."""
+    df = load_analysis_data()
+    return CatalogIndex(df) if df is not None else None
+
 def display_classification_result(result, texts):
     # CORREÇÃO: Remover a exibição do aviso
     # if result.get('warning'): st.warning(texts['warning_ia'].format(result['warning']))
@@ -450,13 +170,39 @@ def render_analysis_page(predictor, texts):
     st.title(texts['analysis_title'])
     st.markdown(texts['analysis_subtitle'])
     
-    df = load_analysis_data()
+    index = load_catalog_index()
     
-    if df is not None:
+    if index is not None:
+        # Os sliders percorrem os limites dos bins do índice, por isso cada filtro é uma fatia exata do cubo
+        st.subheader(texts['analysis_filters_header'])
+        dispositions = st.multiselect(texts['analysis_filter_disposition'], index.dispositions, default=list(index.dispositions))
+        c1, c2, c3 = st.columns(3)
+        with c1:
+            period_range = st.select_slider(texts['analysis_filter_period'], options=range(len(index.period_edges)),
+                                            value=(0, len(index.period_edges) - 1),
+                                            format_func=lambda i: f"{10 ** index.period_edges[i]:.3g}")
+        with c2:
+            radius_range = st.select_slider(texts['analysis_filter_radius'], options=range(len(index.radius_edges)),
+                                            value=(0, len(index.radius_edges) - 1),
+                                            format_func=lambda i: f"{10 ** index.radius_edges[i]:.3g}")
+        with c3:
+            teff_range = st.select_slider(texts['analysis_filter_teff'], options=range(len(index.teff_edges)),
+                                          value=(0, len(index.teff_edges) - 1),
+                                          format_func=lambda i: f"{index.teff_edges[i]:.0f}")
+        period_range = nonempty_range(period_range, len(index.period_edges) - 1)
+        radius_range = nonempty_range(radius_range, len(index.radius_edges) - 1)
+        teff_range = nonempty_range(teff_range, len(index.teff_edges) - 1)
+        filters = (dispositions, period_range, radius_range, teff_range)
+
+        counts = index.counts(*filters)
+        st.markdown(texts['analysis_filtered_count'].format(int(counts.sum())))
+        if index.excluded:
+            st.caption(texts['analysis_excluded_note'].format(index.excluded))
+
         st.subheader(texts['analysis_chart1_title'])
         st.markdown(texts['analysis_chart1_desc'])
         fig1, ax1 = plt.subplots()
-        sns.countplot(data=df, x='koi_disposition', ax=ax1, order=df['koi_disposition'].value_counts().index)
+        sns.barplot(x=counts.index, y=counts.values, ax=ax1)
         ax1.set_xlabel(texts.get('analysis_chart1_xlabel'))
         ax1.set_ylabel(texts.get('analysis_chart1_ylabel'))
         st.pyplot(fig1)
@@ -464,7 +210,11 @@ def render_analysis_page(predictor, texts):
         st.subheader(texts['analysis_chart2_title'])
         st.markdown(texts['analysis_chart2_desc'])
         fig2, ax2 = plt.subplots(figsize=(10, 6))
-        sns.scatterplot(data=df, x='koi_period', y='koi_prad', hue='koi_disposition', alpha=0.5, ax=ax2)
+        hist2d = index.period_radius_histogram(*filters)
+        mesh = ax2.pcolormesh(10 ** index.period_edges[period_range[0]:period_range[1] + 1],
+                              10 ** index.radius_edges[radius_range[0]:radius_range[1] + 1],
+                              np.ma.masked_equal(hist2d.T, 0), cmap='viridis')
+        fig2.colorbar(mesh, ax=ax2, label=texts.get('analysis_chart1_ylabel'))
         ax2.set_xscale('log')
         ax2.set_yscale('log')
         ax2.set_xlabel(texts.get('analysis_chart2_xlabel'))
@@ -474,10 +224,14 @@ def render_analysis_page(predictor, texts):
         st.subheader(texts['analysis_chart3_title'])
         st.markdown(texts['analysis_chart3_desc'])
         fig3, ax3 = plt.subplots()
-        sns.histplot(df['koi_steff'].dropna(), kde=True, ax=ax3, bins=50)
+        ax3.stairs(index.teff_histogram(*filters), index.teff_edges[teff_range[0]:teff_range[1] + 1], fill=True)
         ax3.set_xlabel(texts.get('analysis_chart3_xlabel'))
         ax3.set_ylabel(texts.get('analysis_chart3_ylabel'))
         st.pyplot(fig3)
+
+        st.subheader(texts['analysis_drilldown_title'])
+        if st.checkbox(texts['analysis_drilldown_toggle']):
+            st.dataframe(index.drill_down(*filters))
         
         st.subheader(texts['analysis_chart4_title'])
         st.markdown(texts['analysis_chart4_desc'])
@@ -543,11 +297,11 @@ if 'page' not in st.session_state:
 
 if 'lang' in st.query_params:
     lang_code = st.query_params.get('lang')
-    if lang_code in ['en', 'pt'] and lang_code != st.session_state.lang:
+    if lang_code in get_translations() and lang_code != st.session_state.lang:
         st.session_state.lang = lang_code
         st.rerun()
 
-texts = translations[st.session_state.lang]
+texts = get_translations()[st.session_state.lang]
 
 st.sidebar.markdown(f"""
 <div class="language-selector">
@@ -574,4 +328,7 @@ if predictor:
     elif st.session_state.page == 'reference':
         render_reference_page(texts)
 else:
-    st.error("CRITICAL: AI model could not be loaded. The application cannot continue.")
\ No newline at end of file
+    st.error("CRITICAL: AI model could not be loaded. The application cannot continue.")
+
+if os.environ.get('EXOPLANET_PROFILE'):
+    print(f"[profile] page={st.session_state.page} rerun={(time.perf_counter() - _rerun_start) * 1000:.1f} ms")
@@ -0,0 +1,43 @@
+# i18n.py
+
+import json
+import os
+from types import MappingProxyType
+
+DEFAULT_LANG = 'en'
+
+
+def load_translations(locales_path='locales/'):
+    """
+    Lê os ficheiros de mensagens (um JSON por idioma) e constrói o catálogo de traduções.
+
+    As chaves em falta num idioma são preenchidas a partir dos restantes idiomas,
+    dando prioridade ao idioma por defeito, para evitar KeyErrors nas páginas.
+
+    Args:
+        locales_path (str): O caminho para a pasta que contém os ficheiros <idioma>.json.
+
+    Returns:
+        Mapping: Um mapeamento só de leitura {idioma: {chave: texto}}.
+    """
+    catalog = {}
+    for file_name in sorted(os.listdir(locales_path)):
+        lang, ext = os.path.splitext(file_name)
+        if ext != '.json':
+            continue
+        with open(os.path.join(locales_path, file_name), encoding='utf-8') as f:
+            catalog[lang] = json.load(f)
+
+    fallback_order = sorted(catalog, key=lambda lang: lang != DEFAULT_LANG)
+    for lang, messages in catalog.items():
+        for other in fallback_order:
+            for key, value in catalog[other].items():
+                messages.setdefault(key, value)
+
+    return MappingProxyType({lang: MappingProxyType(messages) for lang, messages in catalog.items()})
+
+
+def load_css(css_path='static/style.css'):
+    """Lê a folha de estilos da aplicação e devolve-a pronta a injetar com st.markdown."""
+    with open(css_path, encoding='utf-8') as f:
+        return f"<style>\n{f.read()}</style>"